@@ -0,0 +1,282 @@
+/*
+  chart.js                          jameshawkins          yyyy-mm-dd:2025-04-28
+
+  Interactive rankings and strokes gained charts for index.qmd.
+
+  Reads the delta-encoded payload written by scripts/chart_data.py and draws
+  each series as SVG in the browser, with play/pause, a time scrubber, a
+  player filter and a choice of highlighted player.
+
+  The payload is a script (figures/web/chart_data.js, setting
+  window.TW_CHART_DATA) rather than fetched JSON, so the charts also work
+  when the page is opened from disk. If the payload or a series is missing,
+  the container shows its <noscript> image instead.
+
+  Usage:
+    <script src="figures/web/chart_data.js" defer></script>
+    <script src="chart.js" defer></script>
+    <div class="tw-chart" data-chart="rankings"><noscript>...</noscript></div>
+*/
+
+(function () {
+  "use strict";
+
+  var SVG_NS = "http://www.w3.org/2000/svg";
+  var WIDTH = 1000, HEIGHT = 460;
+  var MARGIN = { top: 20, right: 150, bottom: 40, left: 50 };
+  var FRAME_MS = 140;
+  var HIGHLIGHT = "#FF0000";
+  var COLOURS = [
+    "#1f77b4", "#17becf", "#2ca02c", "#9467bd", "#7f7f7f", "#8c564b", "#aec7e8",
+    "#98df8a", "#c5b0d5", "#9edae5", "#6baed6", "#31a354", "#756bb1", "#636363", "#74c476"
+  ];
+
+  // ===== Decoding =====
+
+  function decodeX(encoded) {
+    var out = [], total = 0;
+    for (var i = 0; i < encoded.length; i++) {
+      total = i === 0 ? encoded[0] : total + encoded[i];
+      out.push(total);
+    }
+    return out;
+  }
+
+  function decodeSeries(encoded, scale) {
+    var out = [], previous = null;
+    for (var i = 0; i < encoded.length; i++) {
+      if (encoded[i] === null) { out.push(null); continue; }
+      previous = previous === null ? encoded[i] : previous + encoded[i];
+      out.push(previous / scale);
+    }
+    return out;
+  }
+
+  function decode(kind, raw) {
+    var scale = raw.scale || 1;
+    var x = decodeX(raw.x);
+    var labels;
+    if (kind === "rankings") {
+      var start = new Date(raw.start + "T00:00:00Z");
+      x = x.map(function (days) { return new Date(start.getTime() + days * 86400000); });
+      labels = x.map(function (d) { return d.toLocaleDateString("en-GB", { month: "short", year: "numeric", timeZone: "UTC" }); });
+    } else {
+      labels = x.map(String);
+    }
+    var players = Object.keys(raw.players).map(function (name) {
+      return { name: name, values: decodeSeries(raw.players[name], scale) };
+    });
+    var all = [];
+    players.forEach(function (p) { p.values.forEach(function (v) { if (v !== null) all.push(v); }); });
+    return {
+      kind: kind,
+      x: x,
+      labels: labels,
+      players: players,
+      highlight: raw.highlight,
+      yMin: kind === "rankings" ? 1 : Math.floor(Math.min.apply(null, all) * 2) / 2,
+      yMax: kind === "rankings" ? raw.maxRank : Math.ceil(Math.max.apply(null, all) * 2) / 2
+    };
+  }
+
+  // ===== Drawing =====
+
+  function el(tag, attrs, parent) {
+    var node = document.createElementNS(SVG_NS, tag);
+    for (var k in attrs) node.setAttribute(k, attrs[k]);
+    if (parent) parent.appendChild(node);
+    return node;
+  }
+
+  function Chart(container, data) {
+    this.data = data;
+    this.frame = data.x.length - 1;
+    this.hidden = {};
+    this.highlight = data.highlight;
+    this.timer = null;
+
+    var n = data.x.length;
+    var plotW = WIDTH - MARGIN.left - MARGIN.right, plotH = HEIGHT - MARGIN.top - MARGIN.bottom;
+    this.sx = function (i) { return MARGIN.left + (n > 1 ? i / (n - 1) : 0) * plotW; };
+    var span = data.yMax - data.yMin;
+    this.sy = data.kind === "rankings"
+      ? function (v) { return MARGIN.top + (v - data.yMin) / span * plotH; }
+      : function (v) { return MARGIN.top + (data.yMax - v) / span * plotH; };
+
+    this.buildControls(container);
+    this.svg = el("svg", { viewBox: "0 0 " + WIDTH + " " + HEIGHT, width: "100%", role: "img" }, null);
+    container.appendChild(this.svg);
+    this.buildAxes();
+    this.layer = el("g", {}, this.svg);
+    this.render();
+  }
+
+  Chart.prototype.buildAxes = function () {
+    var d = this.data, svg = this.svg, self = this;
+    var axes = el("g", { "font-size": 11, fill: "#444" }, svg);
+
+    // Horizontal grid and y labels
+    var step = d.kind === "rankings" ? 5 : 0.5;
+    var first = d.kind === "rankings" ? 5 : d.yMin;
+    if (d.kind === "rankings") {
+      el("line", { x1: MARGIN.left, x2: WIDTH - MARGIN.right, y1: this.sy(1), y2: this.sy(1), stroke: "#ddd", "stroke-dasharray": "4 3" }, axes);
+      el("text", { x: MARGIN.left - 8, y: this.sy(1) + 4, "text-anchor": "end" }, axes).textContent = "1";
+    }
+    for (var v = first; v <= d.yMax + 1e-9; v += step) {
+      el("line", { x1: MARGIN.left, x2: WIDTH - MARGIN.right, y1: this.sy(v), y2: this.sy(v), stroke: "#ddd", "stroke-dasharray": "4 3" }, axes);
+      el("text", { x: MARGIN.left - 8, y: this.sy(v) + 4, "text-anchor": "end" }, axes).textContent = d.kind === "rankings" ? v : v.toFixed(1);
+    }
+
+    // Year ticks along the x axis
+    var lastYear = null;
+    d.x.forEach(function (x, i) {
+      var year = d.kind === "rankings" ? x.getUTCFullYear() : x;
+      if (year === lastYear || (d.kind === "rankings" && year % 2)) return;
+      lastYear = year;
+      el("text", { x: self.sx(i), y: HEIGHT - MARGIN.bottom + 18, "text-anchor": "middle" }, axes).textContent = year;
+    });
+
+    el("text", { x: 12, y: MARGIN.top + 10, "font-size": 12 }, axes).textContent = d.kind === "rankings" ? "Rank" : "Total SG";
+  };
+
+  Chart.prototype.buildControls = function (container) {
+    var self = this, d = this.data;
+    var bar = document.createElement("div");
+    bar.className = "tw-chart-controls";
+
+    this.play = document.createElement("button");
+    this.play.type = "button";
+    this.play.textContent = "Play";
+    this.play.addEventListener("click", function () { self.toggle(); });
+    bar.appendChild(this.play);
+
+    this.slider = document.createElement("input");
+    this.slider.type = "range";
+    this.slider.min = 0;
+    this.slider.max = d.x.length - 1;
+    this.slider.value = this.frame;
+    this.slider.setAttribute("aria-label", "Time");
+    this.slider.addEventListener("input", function () { self.stop(); self.frame = +self.slider.value; self.render(); });
+    bar.appendChild(this.slider);
+
+    this.dateLabel = document.createElement("span");
+    this.dateLabel.className = "tw-chart-date";
+    bar.appendChild(this.dateLabel);
+
+    var select = document.createElement("select");
+    select.setAttribute("aria-label", "Highlighted player");
+    d.players.map(function (p) { return p.name; }).sort().forEach(function (name) {
+      var option = document.createElement("option");
+      option.value = option.textContent = name;
+      option.selected = name === d.highlight;
+      select.appendChild(option);
+    });
+    select.addEventListener("change", function () { self.highlight = select.value; self.render(); });
+    bar.appendChild(select);
+    container.appendChild(bar);
+
+    // Player filter
+    var filter = document.createElement("details");
+    filter.className = "tw-chart-filter";
+    filter.innerHTML = "<summary>Players</summary>";
+    d.players.forEach(function (p) {
+      var label = document.createElement("label");
+      var box = document.createElement("input");
+      box.type = "checkbox";
+      box.checked = true;
+      box.addEventListener("change", function () { self.hidden[p.name] = !box.checked; self.render(); });
+      label.appendChild(box);
+      label.appendChild(document.createTextNode(" " + p.name));
+      filter.appendChild(label);
+    });
+    container.appendChild(filter);
+  };
+
+  Chart.prototype.render = function () {
+    var self = this, d = this.data, frame = this.frame;
+    while (this.layer.firstChild) this.layer.removeChild(this.layer.firstChild);
+    this.slider.value = frame;
+    this.dateLabel.textContent = d.labels[frame];
+
+    var colourIndex = 0, top = null;
+    d.players.forEach(function (p) {
+      var isTop = p.name === self.highlight;
+      var colour = isTop ? HIGHLIGHT : COLOURS[colourIndex++ % COLOURS.length];
+      if (self.hidden[p.name]) return;
+
+      // Path up to the current frame, broken where a reading is missing
+      var path = "", pen = false, last = null;
+      for (var i = 0; i <= frame; i++) {
+        var v = p.values[i];
+        if (v === null) { pen = false; continue; }
+        path += (pen ? "L" : "M") + self.sx(i).toFixed(1) + "," + self.sy(v).toFixed(1);
+        pen = true;
+        last = i;
+      }
+      if (last === null) return;
+
+      var g = el("g", {}, isTop ? null : self.layer);
+      el("path", { d: path, fill: "none", stroke: colour, "stroke-width": isTop ? 4 : 2.5, "stroke-linejoin": "round" }, g);
+      if (last === frame) {
+        el("circle", { cx: self.sx(frame), cy: self.sy(p.values[frame]), r: isTop ? 5 : 3.5, fill: colour }, g);
+        if (isTop || d.kind === "sg") {
+          var text = p.name + (d.kind === "sg" ? " " + p.values[frame].toFixed(2) : "");
+          el("text", { x: self.sx(frame) + 8, y: self.sy(p.values[frame]) + 4, fill: colour, "font-size": isTop ? 13 : 11, "font-weight": isTop ? "bold" : "normal" }, g).textContent = text;
+        }
+      }
+      el("title", {}, g).textContent = p.name;
+      if (isTop) top = g;
+    });
+    // Highlighted player is drawn last so it sits on top
+    if (top) this.layer.appendChild(top);
+  };
+
+  Chart.prototype.toggle = function () {
+    if (this.timer) { this.stop(); return; }
+    var self = this;
+    if (this.frame >= this.data.x.length - 1) this.frame = 0;
+    this.play.textContent = "Pause";
+    this.timer = setInterval(function () {
+      if (self.frame >= self.data.x.length - 1) { self.stop(); return; }
+      self.frame += 1;
+      self.render();
+    }, FRAME_MS);
+  };
+
+  Chart.prototype.stop = function () {
+    clearInterval(this.timer);
+    this.timer = null;
+    this.play.textContent = "Play";
+  };
+
+  // ===== Setup =====
+
+  // Static image from the container's <noscript> (its markup is plain text when scripts run)
+  function showFallback(container, markup) {
+    container.innerHTML = markup || "<p>This chart could not be loaded.</p>";
+  }
+
+  function init() {
+    var payload = window.TW_CHART_DATA || {};
+    var containers = document.querySelectorAll(".tw-chart");
+    Array.prototype.forEach.call(containers, function (container) {
+      var kind = container.getAttribute("data-chart");
+      var noscript = container.querySelector("noscript");
+      var fallback = noscript ? noscript.textContent : "";
+      if (!payload[kind]) { showFallback(container, fallback); return; }
+      try {
+        var data = decode(kind, payload[kind]);
+        container.innerHTML = "";
+        new Chart(container, data);
+      } catch (e) {
+        showFallback(container, fallback);
+      }
+    });
+  }
+
+  if (document.readyState === "loading") {
+    document.addEventListener("DOMContentLoaded", init);
+  } else {
+    init();
+  }
+})();
@@ -45,17 +45,16 @@ TW_1.py & TW_2.py & TW_3.py         jameshawkins          yyyy-mm-dd:2025-04-28
 # 0. IMPORTS
 # ============================================================================
 
-import pandas as pd
-import matplotlib.pyplot as plt
-import seaborn as sns
+import os
 import time
-from selenium import webdriver
-from selenium.webdriver.chrome.service import Service
-from selenium.webdriver.common.by import By
-from selenium.webdriver.common.keys import Keys
-from selenium.webdriver.chrome.options import Options
+import json
+import re
+from html.parser import HTMLParser
 from concurrent.futures import ThreadPoolExecutor, as_completed
-import matplotlib.ticker as ticker
+
+# pandas, Selenium, matplotlib and seaborn are imported inside the section
+# functions below, so each stage only loads what it needs and nothing starts
+# a browser unless it is a scrape (see `tw.py`)
 
 
 
@@ -63,14 +62,20 @@ import matplotlib.ticker as ticker
 # 1. SCRAPE DATA FROM PGATOUR.COM
 # ============================================================================
 
-# Setup ChromeDriver
+# Path to local ChromeDriver
 CHROMEDRIVER_PATH = "C:/Users/hawki/chromedriver-win64/chromedriver.exe"
-service = Service(CHROMEDRIVER_PATH)
-options = webdriver.ChromeOptions()
-driver = webdriver.Chrome(service=service, options=options)
+
+# Setup ChromeDriver
+def start_driver():
+    from selenium import webdriver
+    from selenium.webdriver.chrome.service import Service
+    service = Service(CHROMEDRIVER_PATH)
+    options = webdriver.ChromeOptions()
+    return webdriver.Chrome(service=service, options=options)
 
 # Setup select all players function
 def select_all_players(driver):
+    from selenium.webdriver.common.by import By
     # Click the dropdown button
     dropdown_button = driver.find_element(By.CSS_SELECTOR, ".css-1lbp250")
     dropdown_button.click()
@@ -80,38 +85,79 @@ def select_all_players(driver):
     all_option.click()
     time.sleep(1) 
 
-# Load main player page and select all players 
-driver.get("https://www.pgatour.com/players")
-time.sleep(5)
-select_all_players(driver) 
-time.sleep(2)
-
-# Scroll to load all players
-last_height = driver.execute_script("return document.body.scrollHeight")
-while True:
-    driver.find_element(By.TAG_NAME, "body").send_keys(Keys.END)
-    time.sleep(3)
-    new_height = driver.execute_script("return document.body.scrollHeight")
-    if new_height == last_height:
-        break
-    last_height = new_height
-
-# Collect player profile links
-player_elements = driver.find_elements(By.CSS_SELECTOR, "a.chakra-linkbox__overlay.css-1hnz6hu")
-
-player_links = []
-for el in player_elements:
-    name = el.text.strip()
-    href = el.get_attribute("href")
-    if name and href and "/player/" in href and "/tournaments/" not in href:
-        player_links.append((name, href))
-
-# Scraper function returns raw stat dict
+# Season stat titles in the embedded __NEXT_DATA__ payload and their column names
+SEASON_STATS = {
+    "Events": "EVENTS PLAYED",
+    "Wins": "PGA TOUR WINS",
+    "Top 5": "TOP 5 FINISHES",
+    "Top 10": "TOP 10 FINISHES",
+    "Cuts Made": "CUTS MADE",
+}
+
+# Pull season-by-season PGA Tour results out of a player's __NEXT_DATA__ payload
+def parse_seasons(name, next_data):
+    performance = next_data["props"]["pageProps"]["profileOverview"]["performance"]
+    seasons = []
+    for season in performance:
+        if season.get("tour") != "R":
+            continue
+        row = {"Player": name, "YEAR": season["season"]}
+        for stat in season["stats"]:
+            if stat["title"] in SEASON_STATS:
+                row[SEASON_STATS[stat["title"]]] = stat["value"]
+        seasons.append(row)
+    return seasons
+
+# First /results page fetched is kept here (next to debug_page.html) to check the RESULT_*_KEYS against
+RESULTS_FIXTURE = "debug_results_page.html"
+
+# Keys that mark a tournament entry, its finishing position and its season in a /results payload
+RESULT_EVENT_KEYS = ("tournamentName", "tournamentId", "tournament")
+RESULT_POSITION_KEYS = ("position", "finishPosition", "finish")
+RESULT_YEAR_KEYS = ("season", "seasonYear", "year")
+
+# Pull per-event PGA Tour finishes out of a player's /results __NEXT_DATA__ payload
+# The payload layout is not fixed, so walk it for tournament entries with a finishing position,
+# taking the season and tour from the nearest enclosing entry that has one
+def parse_results(name, next_data):
+    events = []
+
+    def walk(node, year, tour):
+        if isinstance(node, list):
+            for item in node:
+                walk(item, year, tour)
+            return
+        if not isinstance(node, dict):
+            return
+        for key in RESULT_YEAR_KEYS:
+            value = str(node.get(key) or "")
+            if value[:4].isdigit():
+                year = value[:4]
+                break
+        node_tour = node.get("tourCode") or node.get("tour")
+        if isinstance(node_tour, str):
+            tour = node_tour
+        position = next((node[k] for k in RESULT_POSITION_KEYS if node.get(k) not in (None, "")), None)
+        if position is not None and year and tour in (None, "R") and any(k in node for k in RESULT_EVENT_KEYS):
+            events.append({"Player": name, "YEAR": year, "FINISH": str(position)})
+            return
+        for value in node.values():
+            walk(value, year, tour)
+
+    walk(next_data["props"]["pageProps"], None, None)
+    return events
+
+# Save a /results page as the fixture if there is none yet
+def save_results_fixture(html):
+    if not os.path.exists(RESULTS_FIXTURE):
+        with open(RESULTS_FIXTURE, "w", encoding="utf-8") as f:
+            f.write(html)
+
+# Scraper function returns raw stat dict, season rows and per-event results
 def scrape_player(name, url):
+    from selenium.webdriver.common.by import By
     try:
-        service = Service(CHROMEDRIVER_PATH)
-        options = webdriver.ChromeOptions()
-        driver = webdriver.Chrome(service=service, options=options)
+        driver = start_driver()
         driver.get(url + "/career")
         time.sleep(5)  
 
@@ -126,27 +172,253 @@ def scrape_player(name, url):
             except:
                 continue
 
+        # Season-by-season results for the prime years engine
+        seasons = []
+        try:
+            next_data = driver.find_element(By.ID, "__NEXT_DATA__").get_attribute("innerHTML")
+            seasons = parse_seasons(name, json.loads(next_data))
+        except:
+            pass
+
+        # Per-event results (these carry Top 5 finishes, which the season rows do not)
+        events = []
+        try:
+            driver.get(url + "/results")
+            time.sleep(2)
+            save_results_fixture(driver.page_source)
+            next_data = driver.find_element(By.ID, "__NEXT_DATA__").get_attribute("innerHTML")
+            events = parse_results(name, json.loads(next_data))
+        except:
+            pass
+
         driver.quit()
-        return stats_dict
+        return stats_dict, seasons, events
 
     except Exception as e:
         return None
 
-# Run scraping in parallel
-raw_data = []
-with ThreadPoolExecutor(max_workers=5) as executor:
-    futures = [executor.submit(scrape_player, name, url) for name, url in player_links]
+# ===== Browserless profile fetch =====
+# Profile pages ship their data in an embedded __NEXT_DATA__ JSON blob (see debug_page.html),
+# so most profiles can be read with a plain HTTP request instead of a browser
+
+NEXT_DATA_RE = re.compile(r'<script id="__NEXT_DATA__"[^>]*>(.*?)</script>', re.S)
+
+# Career stat titles in the payload and their column names (same as the scraped labels)
+CAREER_STATS = {
+    "Events": "EVENTS PLAYED",
+    "Wins": "PGA TOUR WINS",
+    "Seconds": "RUNNER UP",
+    "Thirds": "THIRD PLACE FINISHES",
+    "Top 10": "TOP 10 FINISHES",
+    "Top 25": "TOP 25 FINISHES",
+    "Cuts Made": "CUTS MADE",
+    "Earnings": "OFFICIAL MONEY",
+}
 
-    for future in as_completed(futures):
-        result = future.result()
-        if result:
-            raw_data.append(result)
+# Columns the cleaning step needs, a profile missing any of these falls back to Selenium
+REQUIRED_STATS = ["EVENTS PLAYED", "PGA TOUR WINS", "CUTS MADE", "TOP 5 FINISHES", "TOP 10 FINISHES"]
 
-driver.quit()
+HTTP_HEADERS = {
+    "User-Agent": "Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/135.0 Safari/537.36",
+    "Accept-Language": "en-GB,en;q=0.9",
+}
 
-# Convert to dataframe and save to csv
-df_raw = pd.DataFrame(raw_data)
-df_raw.to_csv("data/pga_raw_data.csv", index=False)
+# Collect (label, value) pairs from the server-rendered div.css-11yv56q stat blocks
+class StatDivParser(HTMLParser):
+    def __init__(self):
+        super().__init__()
+        self.depth = 0
+        self.parts = []
+        self.stats = {}
+
+    def handle_starttag(self, tag, attrs):
+        if tag != "div":
+            return
+        if self.depth:
+            self.depth += 1
+        elif "css-11yv56q" in (dict(attrs).get("class") or "").split():
+            self.depth, self.parts = 1, []
+
+    def handle_endtag(self, tag):
+        if tag != "div" or not self.depth:
+            return
+        self.depth -= 1
+        if not self.depth and len(self.parts) == 2:
+            label, value = self.parts
+            self.stats[label.upper()] = value
+
+    def handle_data(self, data):
+        if self.depth and data.strip():
+            self.parts.append(data.strip())
+
+# Decode career stats and season rows from a /career page, or None if there is no payload
+def parse_profile(name, html):
+    match = NEXT_DATA_RE.search(html)
+    if not match:
+        return None
+    try:
+        next_data = json.loads(match.group(1))
+        page_props = next_data["props"]["pageProps"]
+        performance = page_props["profileOverview"]["performance"]
+    except (ValueError, KeyError, TypeError):
+        return None
+
+    # Career totals are repeated on every season entry of a tour, so take them from the first PGA Tour
+    # ("R") entry, as `parse_seasons` does (other tours, e.g. Korn Ferry, carry their own totals)
+    pga_tour = next((entry for entry in performance if entry.get("tour") == "R"), None)
+    stats_dict = {"Player": name}
+    for stat in pga_tour["stats"] if pga_tour else []:
+        if stat["title"] in CAREER_STATS and stat.get("career") not in (None, "", "-"):
+            stats_dict[CAREER_STATS[stat["title"]]] = stat["career"]
+    bio = (page_props.get("player") or {}).get("playerBio") or {}
+    if bio.get("turnedPro"):
+        stats_dict["TURNED PRO"] = bio["turnedPro"]
+
+    # Stats the payload does not carry (e.g. Top 5 Finishes, Year Joined Tour) from the rendered stat divs
+    parser = StatDivParser()
+    parser.feed(html)
+    for label, value in parser.stats.items():
+        stats_dict.setdefault(label, value)
+
+    return stats_dict, parse_seasons(name, next_data)
+
+# Per-event results from a /results page over HTTP (empty if the payload has none)
+def fetch_results(session, name, url):
+    try:
+        response = session.get(url + "/results", timeout=20)
+        response.raise_for_status()
+        save_results_fixture(response.text)
+        match = NEXT_DATA_RE.search(response.text)
+        return parse_results(name, json.loads(match.group(1))) if match else []
+    except Exception as e:
+        return []
+
+# Fetch one profile over HTTP, None means fall back to Selenium
+def fetch_player(session, name, url):
+    try:
+        response = session.get(url + "/career", timeout=20)
+        response.raise_for_status()
+        result = parse_profile(name, response.text)
+    except Exception as e:
+        return None
+    if result is None or any(col not in result[0] for col in REQUIRED_STATS):
+        return None
+    stats_dict, seasons = result
+    return stats_dict, seasons, fetch_results(session, name, url)
+
+# Pooled HTTP session sized for `max_workers` concurrent requests
+def http_session(max_workers):
+    import requests
+    from requests.adapters import HTTPAdapter
+    from urllib3.util.retry import Retry
+
+    session = requests.Session()
+    session.headers.update(HTTP_HEADERS)
+    retry = Retry(total=3, backoff_factor=1, status_forcelist=[429, 500, 502, 503, 504])
+    adapter = HTTPAdapter(pool_connections=max_workers, pool_maxsize=max_workers, max_retries=retry)
+    session.mount("https://", adapter)
+    return session
+
+# Fetch every profile over HTTP, then scrape whatever is left with Selenium
+def fetch_profiles(player_links, max_workers=32):
+    raw_data = []
+    season_data = []
+    event_data = []
+    fallback = []
+
+    session = http_session(max_workers)
+    with ThreadPoolExecutor(max_workers=max_workers) as executor:
+        futures = {executor.submit(fetch_player, session, name, url): (name, url) for name, url in player_links}
+
+        for future in as_completed(futures):
+            result = future.result()
+            if result:
+                stats_dict, seasons, events = result
+                raw_data.append(stats_dict)
+                season_data.extend(seasons)
+                event_data.extend(events)
+            else:
+                fallback.append(futures[future])
+
+    # Profiles without a usable payload go through the browser as before
+    if fallback:
+        print(f"{len(fallback)} of {len(player_links)} profiles had no usable payload, scraping with Selenium")
+        with ThreadPoolExecutor(max_workers=5) as executor:
+            futures = [executor.submit(scrape_player, name, url) for name, url in fallback]
+
+            for future in as_completed(futures):
+                result = future.result()
+                if result:
+                    stats_dict, seasons, events = result
+                    raw_data.append(stats_dict)
+                    season_data.extend(seasons)
+                    event_data.extend(events)
+
+    return raw_data, season_data, event_data
+
+# Scrape every player profile and save raw career stats, season rows and per-event results
+# `fetch="http"` reads profiles from their __NEXT_DATA__ payload, `fetch="selenium"` renders every page in Chrome
+def scrape_profiles(fetch="http"):
+    import pandas as pd
+    from selenium.webdriver.common.by import By
+    from selenium.webdriver.common.keys import Keys
+
+    driver = start_driver()
+
+    # Load main player page and select all players 
+    driver.get("https://www.pgatour.com/players")
+    time.sleep(5)
+    select_all_players(driver) 
+    time.sleep(2)
+
+    # Scroll to load all players
+    last_height = driver.execute_script("return document.body.scrollHeight")
+    while True:
+        driver.find_element(By.TAG_NAME, "body").send_keys(Keys.END)
+        time.sleep(3)
+        new_height = driver.execute_script("return document.body.scrollHeight")
+        if new_height == last_height:
+            break
+        last_height = new_height
+
+    # Collect player profile links
+    player_elements = driver.find_elements(By.CSS_SELECTOR, "a.chakra-linkbox__overlay.css-1hnz6hu")
+
+    player_links = []
+    for el in player_elements:
+        name = el.text.strip()
+        href = el.get_attribute("href")
+        if name and href and "/player/" in href and "/tournaments/" not in href:
+            player_links.append((name, href))
+
+    driver.quit()
+
+    # Run scraping in parallel
+    if fetch == "http":
+        raw_data, season_data, event_data = fetch_profiles(player_links)
+    else:
+        raw_data = []
+        season_data = []
+        event_data = []
+        with ThreadPoolExecutor(max_workers=5) as executor:
+            futures = [executor.submit(scrape_player, name, url) for name, url in player_links]
+
+            for future in as_completed(futures):
+                result = future.result()
+                if result:
+                    stats_dict, seasons, events = result
+                    raw_data.append(stats_dict)
+                    season_data.extend(seasons)
+                    event_data.extend(events)
+
+    # Convert to dataframe and save to csv
+    df_raw = pd.DataFrame(raw_data)
+    df_raw.to_csv("data/pga_raw_data.csv", index=False)
+    df_seasons = pd.DataFrame(season_data)
+    df_seasons.to_csv("data/pga_season_data.csv", index=False)
+    df_events = pd.DataFrame(event_data, columns=["Player", "YEAR", "FINISH"])
+    df_events.to_csv("data/pga_event_results.csv", index=False)
+    print(f"Per-event results for {df_events['Player'].nunique()} of {len(df_raw)} players (sample page: {RESULTS_FIXTURE})")
 
 
 
@@ -154,233 +426,262 @@ df_raw.to_csv("data/pga_raw_data.csv", index=False)
 # 2. DATA CLEANING
 # ============================================================================
 
-df_raw = pd.read_csv("data/pga_raw_data.csv")
-
-# Filter players with more than 20 events played
-df_over20starts = df_raw.copy()
-df_over20starts["EVENTS PLAYED"] = pd.to_numeric(df_over20starts["EVENTS PLAYED"], errors='coerce')
-df_over20starts = df_over20starts[df_over20starts["EVENTS PLAYED"] > 20]
-
-# Convert YEAR JOINED TOUR to numeric
-df_post1968 = df_over20starts.copy()
-df_post1968["YEAR JOINED TOUR"] = pd.to_numeric(df_post1968["YEAR JOINED TOUR"], errors="coerce")
-# Remove players who joined before 1945
-df_post1968 = df_post1968[(df_post1968["YEAR JOINED TOUR"].isna()) | (df_post1968["YEAR JOINED TOUR"] >= 1945)]
-
-# Convert key stats to numeric
-df_clean = df_post1968.copy()
-df_clean["PGA TOUR WINS"] = pd.to_numeric(df_clean["PGA TOUR WINS"], errors='coerce')
-df_clean["CUTS MADE"] = pd.to_numeric(df_clean["CUTS MADE"].astype(str).str.split("/").str[0], errors='coerce')
-df_clean["TOP 5 FINISHES"] = pd.to_numeric(df_clean["TOP 5 FINISHES"], errors='coerce')
-df_clean["TOP 10 FINISHES"] = pd.to_numeric(df_clean["TOP 10 FINISHES"], errors='coerce')
-
-# Calculate Win %
-df_clean["Win %"] = df_clean.apply(
-    lambda row: round(100 * row["PGA TOUR WINS"] / row["EVENTS PLAYED"], 2)
-    if pd.notna(row["EVENTS PLAYED"]) and row["EVENTS PLAYED"] > 0 else 0.0,
-    axis=1
-)
-
-# Calculate Cuts Made %
-df_clean["Cuts Made %"] = df_clean.apply(
-    lambda row: round(100 * row["CUTS MADE"] / row["EVENTS PLAYED"], 2)
-    if pd.notna(row["EVENTS PLAYED"]) and row["EVENTS PLAYED"] > 0 else 0.0,
-    axis=1
-)
-
-# Calculate Top 5 %
-df_clean["Top 5 %"] = df_clean.apply(
-    lambda row: round(100 * row["TOP 5 FINISHES"] / row["EVENTS PLAYED"], 2)
-    if pd.notna(row["EVENTS PLAYED"]) and row["EVENTS PLAYED"] > 0 else 0.0,
-    axis=1
-)
-
-# Calculate Top 10 %
-df_clean["Top 10 %"] = df_clean.apply(
-    lambda row: round(100 * row["TOP 10 FINISHES"] / row["EVENTS PLAYED"], 2)
-    if pd.notna(row["EVENTS PLAYED"]) and row["EVENTS PLAYED"] > 0 else 0.0,
-    axis=1
-)
-
-# Save cleaned dataframe to csv
-df_clean.to_csv("data/pga_clean_data.csv", index=False)
-
+# Filter, convert and add percentage columns to the raw career stats
+def clean_data():
+    import pandas as pd
+
+    df_raw = pd.read_csv("data/pga_raw_data.csv")
+
+    # Filter players with more than 20 events played
+    df_over20starts = df_raw.copy()
+    df_over20starts["EVENTS PLAYED"] = pd.to_numeric(df_over20starts["EVENTS PLAYED"], errors='coerce')
+    df_over20starts = df_over20starts[df_over20starts["EVENTS PLAYED"] > 20]
+
+    # Convert YEAR JOINED TOUR to numeric
+    df_post1968 = df_over20starts.copy()
+    df_post1968["YEAR JOINED TOUR"] = pd.to_numeric(df_post1968["YEAR JOINED TOUR"], errors="coerce")
+    # Remove players who joined before 1945
+    df_post1968 = df_post1968[(df_post1968["YEAR JOINED TOUR"].isna()) | (df_post1968["YEAR JOINED TOUR"] >= 1945)]
+
+    # Convert key stats to numeric
+    df_clean = df_post1968.copy()
+    df_clean["PGA TOUR WINS"] = pd.to_numeric(df_clean["PGA TOUR WINS"], errors='coerce')
+    df_clean["CUTS MADE"] = pd.to_numeric(df_clean["CUTS MADE"].astype(str).str.split("/").str[0], errors='coerce')
+    df_clean["TOP 5 FINISHES"] = pd.to_numeric(df_clean["TOP 5 FINISHES"], errors='coerce')
+    df_clean["TOP 10 FINISHES"] = pd.to_numeric(df_clean["TOP 10 FINISHES"], errors='coerce')
+
+    # Calculate Win %
+    df_clean["Win %"] = df_clean.apply(
+        lambda row: round(100 * row["PGA TOUR WINS"] / row["EVENTS PLAYED"], 2)
+        if pd.notna(row["EVENTS PLAYED"]) and row["EVENTS PLAYED"] > 0 else 0.0,
+        axis=1
+    )
 
+    # Calculate Cuts Made %
+    df_clean["Cuts Made %"] = df_clean.apply(
+        lambda row: round(100 * row["CUTS MADE"] / row["EVENTS PLAYED"], 2)
+        if pd.notna(row["EVENTS PLAYED"]) and row["EVENTS PLAYED"] > 0 else 0.0,
+        axis=1
+    )
 
-# ============================================================================
-# 3. GRAPH BUILDING
-# ============================================================================
+    # Calculate Top 5 %
+    df_clean["Top 5 %"] = df_clean.apply(
+        lambda row: round(100 * row["TOP 5 FINISHES"] / row["EVENTS PLAYED"], 2)
+        if pd.notna(row["EVENTS PLAYED"]) and row["EVENTS PLAYED"] > 0 else 0.0,
+        axis=1
+    )
 
-df_clean = pd.read_csv("data/pga_clean_data.csv")
-
-# Set style globally
-sns.set(style="whitegrid")
-
-# ===== New Prime Tiger Woods data =====
-# To show how good Tiger Woods was in his prime, we will add data to the graphs for his prime years between 1999 and 2008
-prime_tiger = {
-    'Player': 'Tiger Woods 99-08',
-    'EVENTS PLAYED': 173,
-    'PGA TOUR WINS': 56,
-    'Win %': 32.3,
-    'Cuts Made %': 97.7,
-    'Top 5 %': 54.9,
-    'Top 10 %': 72.7,
-}
-# Create Prime Tiger Woods DataFrame
-primetw_df = pd.DataFrame([prime_tiger])
-
-# ===== New Prime Jack Nicklaus data =====
-# Too compare prime Tiger to probably the second best player of all time, we will add data to the graphs for Jack Nicklaus in his prime years between 1962 and 1975
-prime_jack = {
-    'Player': 'Jack Nicklaus 62-75',
-    'EVENTS PLAYED': 273,
-    'PGA TOUR WINS': 54,
-    'Win %': 19.8,
-    'Cuts Made %': 97.4,
-    'Top 5 %': 50.5,
-    'Top 10 %': 70.7,
-}
-primejn_df = pd.DataFrame([prime_jack])
+    # Calculate Top 10 %
+    df_clean["Top 10 %"] = df_clean.apply(
+        lambda row: round(100 * row["TOP 10 FINISHES"] / row["EVENTS PLAYED"], 2)
+        if pd.notna(row["EVENTS PLAYED"]) and row["EVENTS PLAYED"] > 0 else 0.0,
+        axis=1
+    )
 
+    # Save cleaned dataframe to csv
+    df_clean.to_csv("data/pga_clean_data.csv", index=False)
 
-# ===== a) Win Percentage vs Cuts Made Percentage =====
 
-# Create new df that only contains players with valid Win % and Cuts Made %
-df_win_cut = df_clean.dropna(subset=["Win %", "Cuts Made %"]).copy()
 
-plt.figure(figsize=(14, 8))
-sns.scatterplot(data=df_win_cut, x="Win %", y="Cuts Made %", alpha=0.7)
+# ============================================================================
+# 3. GRAPH BUILDING
+# ============================================================================
 
-# List of players to label
-players_to_label = ["Tiger Woods", "Rory McIlroy", "Scottie Scheffler", "Jon Rahm", 
-                    "Seve Ballesteros", "Phil Mickelson", "Min Woo Lee", "Jack Nicklaus",
-                    "Vijay Singh", "Jason Day", "Macdonald Smith", "Willie MacFarlane",
-                    "Bryson DeChambeau", "Bubba Watson", "Patrick Cantlay"]
+# Build the static figures for the blog post
+def build_figures():
+    import pandas as pd
+    import matplotlib.pyplot as plt
+    import matplotlib.ticker as ticker
+    import seaborn as sns
+    from prime_years import prime_windows, season_tallies, merge_top5_tallies
+
+    df_clean = pd.read_csv("data/pga_clean_data.csv")
+
+    # Set style globally
+    sns.set(style="whitegrid")
+
+    # ===== Prime years =====
+    # To show how good players were in their prime, we compute every player's best 10 year window (by Win %)
+    # from their season-by-season results rather than entering the numbers by hand
+    # (season rows come from the profile scrape, so data scraped before it was added has none)
+    if os.path.exists("data/pga_season_data.csv"):
+        df_seasons = pd.read_csv("data/pga_season_data.csv")
+
+        # Only per-event results carry Top 5 finishes, so their tallies fill in Top 5 on the season rows
+        # (for seasons where they cover every event played)
+        if os.path.exists("data/pga_event_results.csv"):
+            df_events = pd.read_csv("data/pga_event_results.csv")
+            if not df_events.empty:
+                df_seasons = merge_top5_tallies(df_seasons, season_tallies(df_events))
+
+        df_prime = prime_windows(df_seasons, years=10, rank_by="Win %", min_events=20)
+        df_prime.to_csv("data/pga_prime_data.csv", index=False)
+    else:
+        print("data/pga_season_data.csv not found, skipping prime points (re-run scrape-profiles to add them)")
+        df_prime = pd.DataFrame(columns=["Player", "Name", "Win %", "Cuts Made %", "Top 5 %", "Top 10 %"])
+
+    # Players whose prime is added to the graphs (Tiger Woods in red, the rest in blue)
+    prime_players = ["Tiger Woods", "Jack Nicklaus"]
+    primetw_df = df_prime[df_prime["Name"] == "Tiger Woods"]
+    primejn_df = df_prime[df_prime["Name"].isin(prime_players) & (df_prime["Name"] != "Tiger Woods")]
+    for player in prime_players if os.path.exists("data/pga_season_data.csv") else []:
+        if player not in set(df_prime["Name"]):
+            print(f"No 10 year window with 20+ events in the season data for {player}, prime point not plotted")
+
+    # Top 5 % is only known when per-event results cover every season of the (same) window,
+    # otherwise that player's prime point is left off the Top 5 vs Top 10 chart
+    df_prime_top5 = df_prime[df_prime["Name"].isin(prime_players)].dropna(subset=["Top 5 %"])
+    for i, row in df_prime[df_prime["Name"].isin(prime_players)].iterrows():
+        if pd.isna(row["Top 5 %"]):
+            print(f"No Top 5 counts for every season of {row['Player']}, prime point left off the Top 5 chart")
+
+
+    # ===== a) Win Percentage vs Cuts Made Percentage =====
+
+    # Create new df that only contains players with valid Win % and Cuts Made %
+    df_win_cut = df_clean.dropna(subset=["Win %", "Cuts Made %"]).copy()
+
+    plt.figure(figsize=(14, 8))
+    sns.scatterplot(data=df_win_cut, x="Win %", y="Cuts Made %", alpha=0.7)
+
+    # List of players to label
+    players_to_label = ["Tiger Woods", "Rory McIlroy", "Scottie Scheffler", "Jon Rahm", 
+                        "Seve Ballesteros", "Phil Mickelson", "Min Woo Lee", "Jack Nicklaus",
+                        "Vijay Singh", "Jason Day", "Macdonald Smith", "Willie MacFarlane",
+                        "Bryson DeChambeau", "Bubba Watson", "Patrick Cantlay"]
+
+    # Add a label for each of the specific players
+    for i, row in df_win_cut.iterrows():
+        if row["Player"] in players_to_label:
+            plt.annotate(row["Player"],
+                         (row["Win %"], row["Cuts Made %"]),
+                         textcoords="offset points", xytext=(0, 5),
+                         ha='center', va='bottom',
+                         fontsize=8, color='black')
+
+    # Add Prime Tiger Woods data
+    sns.scatterplot(data=primetw_df, x="Win %", y="Cuts Made %", color="red", s=50)
+    for i, row in primetw_df.iterrows():
+        plt.annotate(row["Player"],
+                     (row["Win %"], row["Cuts Made %"]),
+                     textcoords="offset points", xytext=(0, 10),
+                     ha='center', va='bottom',
+                     fontsize=8, color='red', weight='bold')
 
-# Add a label for each of the specific players
-for i, row in df_win_cut.iterrows():
-    if row["Player"] in players_to_label:
+    # Add other prime players data
+    sns.scatterplot(data=primejn_df, x="Win %", y="Cuts Made %", color="#4c72b0", alpha=0.7)
+    for i, row in primejn_df.iterrows():
         plt.annotate(row["Player"],
                      (row["Win %"], row["Cuts Made %"]),
-                     textcoords="offset points", xytext=(0, 5),
+                     textcoords="offset points", xytext=(0, 10),
                      ha='center', va='bottom',
                      fontsize=8, color='black')
 
-# Add Prime Tiger Woods data
-sns.scatterplot(data=primetw_df, x="Win %", y="Cuts Made %", color="red", s=50)
-for i, row in primetw_df.iterrows():
-    plt.annotate(row["Player"],
-                 (row["Win %"], row["Cuts Made %"]),
-                 textcoords="offset points", xytext=(0, 10),
-                 ha='center', va='bottom',
-                 fontsize=8, color='red', weight='bold')
-
-# Add Prime Jack Nicklaus data
-sns.scatterplot(data=primejn_df, x="Win %", y="Cuts Made %", color="#4c72b0", alpha=0.7)
-for i, row in primejn_df.iterrows():
-    plt.annotate(row["Player"],
-                 (row["Win %"], row["Cuts Made %"]),
-                 textcoords="offset points", xytext=(0, 10),
-                 ha='center', va='bottom',
-                 fontsize=8, color='black')
-
-# Labels and layout
-plt.title("Win % vs Cuts Made % — Players with 20+ Starts")
-plt.xlabel("Win Percentage")
-plt.ylabel("Cuts Made Percentage")
-plt.tight_layout()
-plt.savefig("figures/win_vs_cuts.png")
-
-
-# ===== b) Top 5% and Top 10% Finishes =====
-
-# Create a new DataFrame that only contains players with valid Top 5% and Top 10% values
-df_top5and10 = df_clean.dropna(subset=["Top 5 %", "Top 10 %"])
-
-# Remove select players who played pre 1913
-players_to_remove = ["Macdonald Smith", "Bobby Locke", "Jim Barnes", "Leo Diegel", "Willie MacFarlane"]
-df_top5and10 = df_top5and10[~df_top5and10["Player"].isin(players_to_remove)]
-
-plt.figure(figsize=(14, 8))
-sns.scatterplot(data=df_top5and10, x="Top 10 %", y="Top 5 %", alpha=0.7)
-
-# List of players to label
-players_to_label = ["Tiger Woods", "Rory McIlroy", "Scottie Scheffler", 
-                    "Phil Mickelson", "Min Woo Lee", "Greg Norman",
-                    "Jason Day", "Bryson DeChambeau", "Bubba Watson",
-                    "Patrick Cantlay", "Victor Ghezzi", "Jack Nicklaus"
-                    "Harry Cooper"]
-
-# Add a label for each of the specific players
-for i, row in df_top5and10.iterrows():
-    if row["Player"] in players_to_label:
+    # Labels and layout
+    plt.title("Win % vs Cuts Made % — Players with 20+ Starts")
+    plt.xlabel("Win Percentage")
+    plt.ylabel("Cuts Made Percentage")
+    plt.tight_layout()
+    plt.savefig("figures/win_vs_cuts.png")
+
+
+    # ===== b) Top 5% and Top 10% Finishes =====
+
+    # Create a new DataFrame that only contains players with valid Top 5% and Top 10% values
+    df_top5and10 = df_clean.dropna(subset=["Top 5 %", "Top 10 %"])
+
+    # Remove select players who played pre 1913
+    players_to_remove = ["Macdonald Smith", "Bobby Locke", "Jim Barnes", "Leo Diegel", "Willie MacFarlane"]
+    df_top5and10 = df_top5and10[~df_top5and10["Player"].isin(players_to_remove)]
+
+    plt.figure(figsize=(14, 8))
+    sns.scatterplot(data=df_top5and10, x="Top 10 %", y="Top 5 %", alpha=0.7)
+
+    # List of players to label
+    players_to_label = ["Tiger Woods", "Rory McIlroy", "Scottie Scheffler", 
+                        "Phil Mickelson", "Min Woo Lee", "Greg Norman",
+                        "Jason Day", "Bryson DeChambeau", "Bubba Watson",
+                        "Patrick Cantlay", "Victor Ghezzi", "Jack Nicklaus"
+                        "Harry Cooper"]
+
+    # Add a label for each of the specific players
+    for i, row in df_top5and10.iterrows():
+        if row["Player"] in players_to_label:
+            plt.annotate(row["Player"],
+                         (row["Top 10 %"], row["Top 5 %"]),
+                         textcoords="offset points", xytext=(0, 10),
+                         ha='center', va='bottom',
+                         fontsize=8, color='black')
+
+    # Add Prime Tiger Woods data (where Top 5 % is known for the window)
+    primetw_top5 = df_prime_top5[df_prime_top5["Name"] == "Tiger Woods"]
+    sns.scatterplot(data=primetw_top5, x="Top 10 %", y="Top 5 %", color="red", s=70)
+    for i, row in primetw_top5.iterrows():
+        plt.annotate(row["Player"],
+                     (row["Top 10 %"], row["Top 5 %"]),
+                     textcoords="offset points", xytext=(0, 10),
+                     ha='center', va='bottom',
+                     fontsize=8, color='red', weight='bold')
+
+    # Add other prime players data
+    primejn_top5 = df_prime_top5[df_prime_top5["Name"] != "Tiger Woods"]
+    sns.scatterplot(data=primejn_top5, x="Top 10 %", y="Top 5 %", color="#4c72b0", alpha=0.7)
+    for i, row in primejn_top5.iterrows():
         plt.annotate(row["Player"],
                      (row["Top 10 %"], row["Top 5 %"]),
                      textcoords="offset points", xytext=(0, 10),
                      ha='center', va='bottom',
                      fontsize=8, color='black')
 
-# Add Prime Tiger Woods data
-sns.scatterplot(data=primetw_df, x="Top 10 %", y="Top 5 %", color="red", s=70)
-for i, row in primetw_df.iterrows():
-    plt.annotate(row["Player"],
-                 (row["Top 10 %"], row["Top 5 %"]),
-                 textcoords="offset points", xytext=(0, 10),
-                 ha='center', va='bottom',
-                 fontsize=8, color='red', weight='bold')
-
-# Add Prime Jack Nicklaus data
-sns.scatterplot(data=primejn_df, x="Top 10 %", y="Top 5 %", color="#4c72b0", alpha=0.7)
-for i, row in primejn_df.iterrows():
-    plt.annotate(row["Player"],
-                 (row["Top 10 %"], row["Top 5 %"]),
-                 textcoords="offset points", xytext=(0, 10),
-                 ha='center', va='bottom',
-                 fontsize=8, color='black')
-
-# Labels and layout
-plt.title("Top 5% vs Top 10% Finishes — Players with 20+ Starts")
-plt.xlabel("% of Finishes in Top 10")
-plt.ylabel("% of Finishes in Top 5")
-plt.tight_layout()
-plt.savefig("figures/top5_vs_top10.png")
-
-
-# ===== c) Top Career Earnings =====
-
-# Convert OFFICIAL MONEY to numeric
-df_clean["OFFICIAL MONEY"] = (
-    df_clean["OFFICIAL MONEY"]
-    .replace(r'[\$,]', '', regex=True)
-    .astype(float)
-)
-
-# Create a new DataFrame that only contains players with valid Earnings values
-df_top_earnings = df_clean.sort_values("OFFICIAL MONEY", ascending=False).head(20)
-
-plt.figure(figsize=(10, 8))
-barplot = sns.barplot(
-    data=df_top_earnings,
-    x="OFFICIAL MONEY",
-    y="Player",
-)
-
-# Add earnings labels to bars
-for i, row in df_top_earnings.iterrows():
-    barplot.text(
-        row["OFFICIAL MONEY"] + 100000,
-        df_top_earnings.index.get_loc(i),
-        f"${row['OFFICIAL MONEY']:,.0f}",
-        va="center"
+    # Labels and layout
+    plt.title("Top 5% vs Top 10% Finishes — Players with 20+ Starts")
+    plt.xlabel("% of Finishes in Top 10")
+    plt.ylabel("% of Finishes in Top 5")
+    plt.tight_layout()
+    plt.savefig("figures/top5_vs_top10.png")
+
+
+    # ===== c) Top Career Earnings =====
+
+    # Convert OFFICIAL MONEY to numeric
+    df_clean["OFFICIAL MONEY"] = (
+        df_clean["OFFICIAL MONEY"]
+        .replace(r'[\$,]', '', regex=True)
+        .astype(float)
     )
 
-# Format x-axis with dollar formatting
-plt.gca().xaxis.set_major_formatter(ticker.FuncFormatter(lambda x, _: f'${x:,.0f}'))
+    # Create a new DataFrame that only contains players with valid Earnings values
+    df_top_earnings = df_clean.sort_values("OFFICIAL MONEY", ascending=False).head(20)
+
+    plt.figure(figsize=(10, 8))
+    barplot = sns.barplot(
+        data=df_top_earnings,
+        x="OFFICIAL MONEY",
+        y="Player",
+    )
+
+    # Add earnings labels to bars
+    for i, row in df_top_earnings.iterrows():
+        barplot.text(
+            row["OFFICIAL MONEY"] + 100000,
+            df_top_earnings.index.get_loc(i),
+            f"${row['OFFICIAL MONEY']:,.0f}",
+            va="center"
+        )
+
+    # Format x-axis with dollar formatting
+    plt.gca().xaxis.set_major_formatter(ticker.FuncFormatter(lambda x, _: f'${x:,.0f}'))
+
+    # Labels and layout
+    plt.title("PGA Tour Career Earnings — Top 20 All Time", fontsize=14, weight='bold')
+    plt.xlabel("Official Earnings")
+    plt.ylabel("")
+    plt.tight_layout()
+    plt.savefig("figures/earnings.png")
+
+
 
-# Labels and layout
-plt.title("PGA Tour Career Earnings — Top 20 All Time", fontsize=14, weight='bold')
-plt.xlabel("Official Earnings")
-plt.ylabel("")
-plt.tight_layout()
-plt.savefig("figures/earnings.png")
+if __name__ == "__main__":
+    scrape_profiles()
+    clean_data()
+    build_figures()
@@ -0,0 +1,174 @@
+"""
+chart_data.py                       jameshawkins          yyyy-mm-dd:2025-04-28
+---|----1----|----2----|----3----|----4----|----5----|----6----|----7----|----8
+
+  Compact data payload for the interactive charts in `index.qmd`.
+
+  Instead of rendering every animation frame to video, the rankings and
+  strokes gained series are written once to `figures/web/chart_data.js`
+  and animated in the browser by `chart.js` (top level of this directory),
+  which adds player filtering and a time scrubber. The payload is a script
+  that sets `window.TW_CHART_DATA` rather than a JSON file, so the charts
+  load without `fetch` (which fails when the page is opened from disk).
+
+  The payload is delta-encoded to keep it small:
+    - x values (dates as days, or years) store the first value followed by
+      the step from the previous value
+    - each player's series stores the first value followed by the change
+      from the previous non-missing value; `null` marks a missing reading
+    - strokes gained is stored as integer hundredths (`scale` = 100)
+
+  A static PNG of each chart's final state is also written to `figures/`,
+  so `web_assets.py` turns it into the `<noscript>` fallback for readers
+  without JavaScript.
+"""
+
+
+
+# ============================================================================
+# 0. IMPORTS
+# ============================================================================
+
+import os
+import json
+import pandas as pd
+import matplotlib.pyplot as plt
+
+
+
+# ============================================================================
+# 1. DELTA ENCODING
+# ============================================================================
+
+CHART_DATA_PATH = "figures/web/chart_data.js"
+
+# Static fallbacks for readers without JavaScript (picked up by web_assets.py)
+STATIC_PATHS = {
+    "rankings": "figures/rankings_static.png",
+    "sg": "figures/strokesgained_static.png",
+}
+
+# [first, step, step, ...] for a list of ints
+def delta_encode(values):
+    return [values[0]] + [b - a for a, b in zip(values, values[1:])] if values else []
+
+# Same as `delta_encode`, but NaN readings become null and are skipped over
+def delta_encode_series(values):
+    encoded, previous = [], None
+    for value in values:
+        if pd.isna(value):
+            encoded.append(None)
+            continue
+        value = int(value)
+        encoded.append(value if previous is None else value - previous)
+        previous = value
+    return encoded
+
+
+
+# ============================================================================
+# 2. SERIES
+# ============================================================================
+
+# Rankings of the former No. 1s by snapshot date (top 30 only, as in the animation)
+def rankings_pivot(path="data/no1s_rankings.csv", max_rank=30):
+    df = pd.read_csv(path)
+    df["date"] = pd.to_datetime(df["date"])
+    df = df[df["rank"] <= max_rank]
+    return df.pivot(index="date", columns="player", values="rank").sort_index()
+
+# Total strokes gained per season for the top players each year
+def strokes_gained_pivot(path="data/strokes_gained.csv"):
+    df = pd.read_csv(path)
+    df["year"] = df["year"].astype(int)
+    return df.pivot(index="year", columns="player", values="sg_total").sort_index()
+
+# Delta-encoded rankings payload
+def rankings_series(path="data/no1s_rankings.csv", max_rank=30):
+    pivot_df = rankings_pivot(path, max_rank)
+
+    start = pivot_df.index[0]
+    days = [(d - start).days for d in pivot_df.index]
+    return {
+        "start": start.strftime("%Y-%m-%d"),
+        "x": delta_encode(days),
+        "maxRank": max_rank,
+        "players": {p: delta_encode_series(pivot_df[p].tolist()) for p in pivot_df.columns},
+        "highlight": "Woods Tiger",
+    }
+
+# Delta-encoded strokes gained payload (integer hundredths)
+def strokes_gained_series(path="data/strokes_gained.csv", scale=100):
+    pivot_df = (strokes_gained_pivot(path) * scale).round()
+
+    return {
+        "x": delta_encode(pivot_df.index.tolist()),
+        "scale": scale,
+        "players": {p: delta_encode_series(pivot_df[p].tolist()) for p in pivot_df.columns},
+        "highlight": "Tiger Woods",
+    }
+
+
+
+# ============================================================================
+# 3. STATIC FALLBACKS
+# ============================================================================
+
+# Final state of one chart as a PNG: every player's full line, the highlighted player in red on top
+def save_static(pivot_df, highlight, path, ylabel, invert=False):
+    fig, ax = plt.subplots(figsize=(14, 6.5))
+    for player in pivot_df.columns:
+        if player != highlight:
+            ax.plot(pivot_df.index, pivot_df[player], linewidth=1.5, alpha=0.6)
+    if highlight in pivot_df.columns:
+        ax.plot(pivot_df.index, pivot_df[highlight], color="#FF0000", linewidth=3, label=highlight)
+        ax.legend(loc="upper right", frameon=False)
+    if invert:
+        ax.invert_yaxis()
+    ax.set_ylabel(ylabel)
+    ax.grid(True, linestyle="--", alpha=0.4)
+    fig.tight_layout()
+    fig.savefig(path, dpi=100)
+    plt.close(fig)
+
+
+
+# ============================================================================
+# 4. EXPORT
+# ============================================================================
+
+# Placeholder fallback snippet for a series that has not been scraped, so the include in index.qmd
+# still resolves (web_assets.py replaces it once the static PNG exists)
+def write_placeholder(kind, message):
+    static_path = STATIC_PATHS[kind]
+    if os.path.exists(static_path):
+        os.remove(static_path)
+    name = os.path.splitext(os.path.basename(static_path))[0]
+    with open(f"{os.path.dirname(CHART_DATA_PATH)}/{name}.md", "w", encoding="utf-8") as f:
+        f.write(f"<p>{message}</p>\n")
+    print(f"No data for the {kind} chart, wrote a placeholder")
+
+# Write whichever series have data to the chart payload, plus a static fallback for each
+def export_chart_data(path=CHART_DATA_PATH):
+    os.makedirs(os.path.dirname(path), exist_ok=True)
+    payload = {}
+    if os.path.exists("data/no1s_rankings.csv"):
+        payload["rankings"] = rankings_series()
+        save_static(rankings_pivot(), payload["rankings"]["highlight"], STATIC_PATHS["rankings"], "Rank", invert=True)
+    else:
+        write_placeholder("rankings", "Rankings data has not been scraped yet (tw.py scrape-rankings).")
+    if os.path.exists("data/strokes_gained.csv"):
+        payload["sg"] = strokes_gained_series()
+        save_static(strokes_gained_pivot(), payload["sg"]["highlight"], STATIC_PATHS["sg"], "Total SG")
+    else:
+        write_placeholder("sg", "Strokes gained data has not been scraped yet (tw.py scrape-sg).")
+
+    with open(path, "w", encoding="utf-8") as f:
+        f.write("window.TW_CHART_DATA = " + json.dumps(payload, separators=(",", ":")) + ";\n")
+    print(f"Wrote {path} ({os.path.getsize(path) / 1024:,.1f} KB)")
+    return payload
+
+
+
+if __name__ == "__main__":
+    export_chart_data()
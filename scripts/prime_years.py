@@ -0,0 +1,170 @@
+"""
+prime_years.py                      jameshawkins          yyyy-mm-dd:2025-04-28
+---|----1----|----2----|----3----|----4----|----5----|----6----|----7----|----8
+
+  Sliding-window "prime years" engine used by `TW_1.py` (Section 3).
+
+  Rather than entering a player's prime by hand, every player's results are
+  tallied by season and the best N-year window is found for each player in a
+  single pass using prefix sums, so each window total is one subtraction
+  instead of a re-count of every event in the window.
+
+  Input can be either:
+    - per-event results with columns `Player`, `YEAR`, `FINISH`
+      (finishing position such as "1", "T5", "CUT", "W/D"), tallied with
+      `season_tallies`, or
+    - per-season tallies with columns `Player`, `YEAR` and any of the count
+      columns used in the career data (`EVENTS PLAYED`, `PGA TOUR WINS`,
+      `TOP 5 FINISHES`, `TOP 10 FINISHES`, `CUTS MADE`).
+
+  The profile season rows have no Top 5 counts, so `merge_top5_tallies`
+  fills them in from per-event tallies, but only for seasons where the
+  tallies cover every event the season row says was played. A window with
+  a season missing a count gets no percentage for it (NaN) rather than a
+  partial one.
+
+  `prime_windows` returns one row per player in the same shape as the
+  cleaned career data, so the rows can be plotted straight onto the
+  scatter charts.
+"""
+
+
+
+# ============================================================================
+# 0. IMPORTS
+# ============================================================================
+
+import numpy as np
+import pandas as pd
+
+
+
+# ============================================================================
+# 1. SEASON TALLIES
+# ============================================================================
+
+# Count columns and the percentage each one feeds (matches `df_clean`)
+COUNT_COLUMNS = {
+    "PGA TOUR WINS": "Win %",
+    "TOP 5 FINISHES": "Top 5 %",
+    "TOP 10 FINISHES": "Top 10 %",
+    "CUTS MADE": "Cuts Made %",
+}
+
+# Tally per-event results into one row per player per season
+def season_tallies(events_df):
+    events = events_df[["Player", "YEAR", "FINISH"]].copy()
+    events["YEAR"] = pd.to_numeric(events["YEAR"], errors="coerce")
+    events = events.dropna(subset=["YEAR"])
+
+    # "T5" -> 5, anything without a position ("CUT", "W/D", "DQ") -> NaN
+    position = pd.to_numeric(
+        events["FINISH"].astype(str).str.upper().str.lstrip("T"), errors="coerce"
+    )
+    events["EVENTS PLAYED"] = 1
+    events["PGA TOUR WINS"] = (position == 1).astype(int)
+    events["TOP 5 FINISHES"] = (position <= 5).astype(int)
+    events["TOP 10 FINISHES"] = (position <= 10).astype(int)
+    events["CUTS MADE"] = position.notna().astype(int)
+
+    tallies = (
+        events.drop(columns="FINISH")
+        .groupby(["Player", "YEAR"], as_index=False)
+        .sum()
+    )
+    tallies["YEAR"] = tallies["YEAR"].astype(int)
+    return tallies
+
+# Fill `TOP 5 FINISHES` on the season rows from per-event tallies, per player and season
+# The season rows stay the source of truth: a tallied season only counts if it covers every event played
+def merge_top5_tallies(seasons_df, tallies_df):
+    seasons = seasons_df.copy()
+    seasons["YEAR"] = pd.to_numeric(seasons["YEAR"], errors="coerce")
+    seasons = seasons.dropna(subset=["YEAR"])
+    seasons["YEAR"] = seasons["YEAR"].astype(int)
+
+    tallies = tallies_df[["Player", "YEAR", "EVENTS PLAYED", "TOP 5 FINISHES"]].rename(
+        columns={"EVENTS PLAYED": "TALLIED EVENTS", "TOP 5 FINISHES": "TALLIED TOP 5"}
+    )
+    seasons = seasons.merge(tallies, on=["Player", "YEAR"], how="left")
+
+    covered = seasons["TALLIED EVENTS"] == pd.to_numeric(seasons["EVENTS PLAYED"], errors="coerce")
+    top5 = seasons["TALLIED TOP 5"].where(covered)
+    if "TOP 5 FINISHES" in seasons.columns:
+        top5 = pd.to_numeric(seasons["TOP 5 FINISHES"], errors="coerce").fillna(top5)
+    seasons["TOP 5 FINISHES"] = top5
+    return seasons.drop(columns=["TALLIED EVENTS", "TALLIED TOP 5"])
+
+
+
+# ============================================================================
+# 2. BEST N-YEAR WINDOW (PREFIX SUMS)
+# ============================================================================
+
+# Best window for one player; `seasons` is that player's tallies
+def _best_window(seasons, years, rank_by, min_events, counts):
+    # Seasons with events but no reading for a count (e.g. no Top 5 tallies that year)
+    gaps = [f"{col} GAP" for col in counts]
+    seasons = seasons.assign(**{
+        gap: seasons[col].isna() & (seasons["EVENTS PLAYED"] > 0) for gap, col in zip(gaps, counts)
+    })
+    seasons = seasons.groupby("YEAR")[["EVENTS PLAYED"] + counts + gaps].sum()
+
+    # Fill gap seasons with zeros so a window always spans `years` calendar years
+    first, last = seasons.index.min(), seasons.index.max()
+    if last - first + 1 < years:
+        return None
+    seasons = seasons.reindex(range(first, last + 1), fill_value=0)
+
+    # Prefix sums: window total for years [i, i + years) is prefix[i + years] - prefix[i]
+    prefix = np.vstack([np.zeros(seasons.shape[1]), seasons.to_numpy().cumsum(axis=0)])
+    windows = prefix[years:] - prefix[:-years]
+
+    events = windows[:, 0]
+    rank_col = 1 + counts.index(rank_by)
+    gap_col = 1 + len(counts) + counts.index(rank_by)
+    valid = (events >= max(min_events, 1)) & (windows[:, gap_col] == 0)
+    if not valid.any():
+        return None
+
+    score = np.where(valid, windows[:, rank_col] / np.where(valid, events, 1), -1.0)
+    best = int(score.argmax())
+
+    start = int(seasons.index[best])
+    row = {"START": start, "END": start + years - 1, "EVENTS PLAYED": int(events[best])}
+    for i, col in enumerate(counts):
+        if windows[best, 1 + len(counts) + i]:
+            continue
+        row[col] = int(windows[best, 1 + i])
+        row[COUNT_COLUMNS[col]] = round(100 * windows[best, 1 + i] / events[best], 1)
+    return row
+
+# Best `years`-long window for every player, ranked by `rank_by` (e.g. "Win %")
+def prime_windows(seasons_df, years=10, rank_by="Win %", min_events=20, players=None):
+    counts = [col for col in COUNT_COLUMNS if col in seasons_df.columns]
+    rank_count = {pct: col for col, pct in COUNT_COLUMNS.items()}.get(rank_by)
+    if rank_count not in counts:
+        raise ValueError(f"Cannot rank by {rank_by!r}: no {rank_count!r} column in season data")
+
+    df = seasons_df.copy()
+    df["YEAR"] = pd.to_numeric(df["YEAR"], errors="coerce")
+    df = df.dropna(subset=["YEAR"])
+    df["YEAR"] = df["YEAR"].astype(int)
+    df["EVENTS PLAYED"] = pd.to_numeric(df["EVENTS PLAYED"], errors="coerce").fillna(0)
+    for col in counts:
+        df[col] = pd.to_numeric(df[col], errors="coerce")
+    if players is not None:
+        df = df[df["Player"].isin(players)]
+
+    rows = []
+    for player, seasons in df.groupby("Player", sort=False):
+        row = _best_window(seasons, years, rank_count, min_events, counts)
+        if row is None:
+            continue
+        row["Player"] = f"{player} {row['START'] % 100:02d}-{row['END'] % 100:02d}"
+        row["Name"] = player
+        rows.append(row)
+
+    # Percentages without a count for every season of the window are left as NaN
+    columns = ["Player", "Name", "START", "END", "EVENTS PLAYED"] + counts + list(COUNT_COLUMNS.values())
+    return pd.DataFrame(rows, columns=columns)
@@ -0,0 +1,177 @@
+"""
+rankings_stats.py                   jameshawkins          yyyy-mm-dd:2025-04-28
+---|----1----|----2----|----3----|----4----|----5----|----6----|----7----|----8
+
+  Streaming analytics over ranking snapshots used by `TW_2.py` (Section 4).
+
+  Snapshots are fed in date order, one at a time, and each player keeps a
+  small running state, so the rankings are never pivoted. The tracker can
+  be saved and loaded, and `update_from_frame` skips snapshots it has
+  already seen. New weekly snapshots therefore update a saved tracker
+  without replaying the whole history. `summarise_rankings` in `TW_2.py`
+  reads the CSV in chunks and keeps only the rows newer than the saved
+  tracker, so only the new snapshots are held in memory.
+
+  A rank holds from its snapshot until the next one, so each snapshot is
+  credited with the weeks up to the following snapshot. The latest snapshot
+  is held back until the next one arrives and counts for `interval_weeks`
+  (the nominal sampling interval) in the summary. The numbers are exact for
+  weekly data (`interval_weeks=1`) and an estimate for the quarterly samples
+  scraped in `TW_2.py` (`interval_weeks=13`).
+
+  Per player the tracker reports (units in the column names):
+    - weeks at No. 1 and weeks ranked
+    - longest run (in weeks) inside the top `k` for each `k` in `top_k`
+    - rank volatility (standard deviation of snapshot-to-snapshot rank
+      change, in ranking places)
+    - rank-change index (mean absolute rank change per snapshot, in places)
+    - time to peak (weeks from first ranked snapshot to best rank)
+"""
+
+
+
+# ============================================================================
+# 0. IMPORTS
+# ============================================================================
+
+import copy
+import math
+import pickle
+import pandas as pd
+
+
+
+# ============================================================================
+# 1. RANKINGS TRACKER
+# ============================================================================
+
+class RankingsTracker:
+
+    def __init__(self, top_k=(1, 5, 10), interval_weeks=1):
+        self.top_k = tuple(top_k)
+        self.interval_weeks = interval_weeks
+        self.last_date = None
+        self.last_ranks = None
+        self.snapshots = 0
+        self.players = {}
+
+    # New running state for a player first seen at `date`
+    def _new_player(self, date):
+        return {
+            "first_date": date,
+            "last_rank": None,
+            "best_rank": None,
+            "best_date": None,
+            "weeks_ranked": 0.0,
+            "weeks_at_1": 0.0,
+            "streak": {k: 0.0 for k in self.top_k},
+            "longest": {k: 0.0 for k in self.top_k},
+            # Welford running mean / variance of rank changes
+            "changes": 0,
+            "change_mean": 0.0,
+            "change_m2": 0.0,
+            "abs_change": 0.0,
+        }
+
+    # Credit `ranks` with the `weeks` they held for (weeks ranked, weeks at No. 1, top-k streaks)
+    def _credit(self, ranks, weeks):
+        for player, state in self.players.items():
+            rank = ranks.get(player)
+            if rank is None:
+                # Players missing from the snapshot drop out of every streak
+                for k in self.top_k:
+                    state["streak"][k] = 0.0
+                continue
+
+            state["weeks_ranked"] += weeks
+            if rank == 1:
+                state["weeks_at_1"] += weeks
+            for k in self.top_k:
+                if rank <= k:
+                    state["streak"][k] += weeks
+                    state["longest"][k] = max(state["longest"][k], state["streak"][k])
+                else:
+                    state["streak"][k] = 0.0
+
+    # Add one snapshot: `ranks` maps player -> rank on `date`
+    def update(self, date, ranks):
+        date = pd.Timestamp(date)
+        if self.last_date is not None and date <= self.last_date:
+            raise ValueError(f"Snapshot {date.date()} is not after the last snapshot {self.last_date.date()}")
+        ranks = {player: int(rank) for player, rank in ranks.items()}
+
+        # The previous snapshot's ranks held until this one
+        if self.last_ranks is not None:
+            self._credit(self.last_ranks, (date - self.last_date).days / 7)
+
+        for player, rank in ranks.items():
+            state = self.players.get(player)
+            if state is None:
+                state = self.players[player] = self._new_player(date)
+
+            # Rank changes since the player's previous snapshot
+            if state["last_rank"] is not None:
+                change = rank - state["last_rank"]
+                state["changes"] += 1
+                delta = change - state["change_mean"]
+                state["change_mean"] += delta / state["changes"]
+                state["change_m2"] += delta * (change - state["change_mean"])
+                state["abs_change"] += abs(change)
+            state["last_rank"] = rank
+
+            # Peak (first time the best rank is reached)
+            if state["best_rank"] is None or rank < state["best_rank"]:
+                state["best_rank"] = rank
+                state["best_date"] = date
+
+        self.last_date = date
+        self.last_ranks = ranks
+        self.snapshots += 1
+
+    # Feed a long dataframe (date, player, rank) one snapshot at a time
+    def update_from_frame(self, rankings_df, date_col="date", player_col="player", rank_col="rank"):
+        df = rankings_df.copy()
+        df[date_col] = pd.to_datetime(df[date_col])
+        if self.last_date is not None:
+            df = df[df[date_col] > self.last_date]
+        for date, snapshot in df.sort_values(date_col).groupby(date_col, sort=True):
+            self.update(date, dict(zip(snapshot[player_col], snapshot[rank_col])))
+        return self
+
+    # One row per player, sorted by weeks at No. 1
+    def summary(self):
+        # Credit the latest snapshot with the nominal interval on a copy, so later updates are unaffected
+        tracker = copy.deepcopy(self)
+        if tracker.last_ranks is not None:
+            tracker._credit(tracker.last_ranks, tracker.interval_weeks)
+
+        rows = []
+        for player, state in tracker.players.items():
+            n = state["changes"]
+            row = {
+                "player": player,
+                "best_rank": state["best_rank"],
+                "weeks_at_1": round(state["weeks_at_1"]),
+                "weeks_ranked": round(state["weeks_ranked"]),
+                "rank_volatility_places": round(math.sqrt(state["change_m2"] / (n - 1)), 2) if n > 1 else 0.0,
+                "rank_change_index_places": round(state["abs_change"] / n, 2) if n else 0.0,
+                "weeks_to_peak": round((state["best_date"] - state["first_date"]).days / 7),
+            }
+            for k in self.top_k:
+                row[f"longest_top{k}_streak_weeks"] = round(state["longest"][k])
+            rows.append(row)
+
+        summary_df = pd.DataFrame(rows)
+        if summary_df.empty:
+            return summary_df
+        return summary_df.sort_values(["weeks_at_1", "best_rank"], ascending=[False, True]).reset_index(drop=True)
+
+    # Save / load tracker state so later snapshots can be added incrementally
+    def save(self, path):
+        with open(path, "wb") as f:
+            pickle.dump(self, f)
+
+    @staticmethod
+    def load(path):
+        with open(path, "rb") as f:
+            return pickle.load(f)
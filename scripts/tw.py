@@ -0,0 +1,109 @@
+"""
+tw.py                               jameshawkins          yyyy-mm-dd:2025-04-28
+---|----1----|----2----|----3----|----4----|----5----|----6----|----7----|----8
+
+  Single command-line entry point for the project. Each subcommand runs one
+  stage of `TW_1.py`, `TW_2.py` or `TW_3.py` and only imports what that
+  stage needs, so regenerating a chart does not load Selenium or start a
+  browser. Only the scrape-* subcommands launch Chrome.
+
+  Usage (from the top level of this directory):
+    python scripts/tw.py scrape-profiles [--fetch http|selenium]   # Section 1  -> data/pga_raw_data.csv
+    python scripts/tw.py scrape-rankings     # Section 4  -> data/no1s_rankings.csv
+    python scripts/tw.py scrape-sg           # Section 6  -> data/strokes_gained.csv
+    python scripts/tw.py clean               # Section 2 and rankings summary
+    python scripts/tw.py figures             # Section 3  -> figures/*.png
+    python scripts/tw.py animate [--chart rankings|sg]   # Sections 5 and 7
+    python scripts/tw.py chart-data          # figures/web/chart_data.js and static fallbacks for the interactive charts
+    python scripts/tw.py web-assets [--videos]   # figures/web/ (WebP/AVIF, with --videos also previews and posters)
+"""
+
+
+
+# ============================================================================
+# 0. IMPORTS
+# ============================================================================
+
+import os
+import argparse
+
+
+
+# ============================================================================
+# SUBCOMMANDS
+# ============================================================================
+
+def scrape_profiles(args):
+    from TW_1 import scrape_profiles
+    scrape_profiles(fetch=args.fetch)
+
+def scrape_rankings(args):
+    from TW_2 import scrape_rankings
+    scrape_rankings()
+
+def scrape_sg(args):
+    from TW_3 import scrape_strokes_gained
+    scrape_strokes_gained()
+
+def clean(args):
+    from TW_1 import clean_data
+    from TW_2 import summarise_rankings
+    clean_data()
+    # Rankings are scraped separately, so only summarise them once they exist
+    if os.path.exists("data/no1s_rankings.csv"):
+        summarise_rankings()
+    else:
+        print("data/no1s_rankings.csv not found, skipping rankings summary")
+
+def figures(args):
+    from TW_1 import build_figures
+    build_figures()
+
+def animate(args):
+    if args.chart in ("all", "rankings"):
+        from TW_2 import animate_rankings
+        animate_rankings()
+    if args.chart in ("all", "sg"):
+        from TW_3 import animate_strokes_gained
+        animate_strokes_gained()
+
+def web_assets(args):
+    from web_assets import export_web_assets
+    export_web_assets(videos=args.videos)
+
+def chart_data(args):
+    from chart_data import export_chart_data
+    export_chart_data()
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(prog="tw", description="Tiger Woods empirical project pipeline")
+    subparsers = parser.add_subparsers(dest="command", required=True)
+
+    profiles_parser = subparsers.add_parser("scrape-profiles", help="scrape PGA Tour player profiles")
+    profiles_parser.add_argument("--fetch", choices=["http", "selenium"], default="http",
+                                 help="read profiles over plain HTTP (Selenium only as fallback) or render every page in Chrome")
+    profiles_parser.set_defaults(func=scrape_profiles)
+
+    subparsers.add_parser("scrape-rankings", help="scrape DataGolf rankings history").set_defaults(func=scrape_rankings)
+    subparsers.add_parser("scrape-sg", help="scrape DataGolf strokes gained").set_defaults(func=scrape_sg)
+    subparsers.add_parser("clean", help="clean profile data and summarise rankings").set_defaults(func=clean)
+    subparsers.add_parser("figures", help="build the static figures").set_defaults(func=figures)
+
+    animate_parser = subparsers.add_parser("animate", help="render the animated charts")
+    animate_parser.add_argument("--chart", choices=["all", "rankings", "sg"], default="all")
+    animate_parser.set_defaults(func=animate)
+
+    web_assets_parser = subparsers.add_parser("web-assets", help="build size-budgeted figures (and videos) for the site")
+    web_assets_parser.add_argument("--videos", action="store_true",
+                                   help="also encode previews and posters of the animations (not used by the blog)")
+    web_assets_parser.set_defaults(func=web_assets)
+
+    subparsers.add_parser("chart-data", help="export the interactive chart payload").set_defaults(func=chart_data)
+
+    args = parser.parse_args(argv)
+    args.func(args)
+
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,273 @@
+"""
+web_assets.py                       jameshawkins          yyyy-mm-dd:2025-04-28
+---|----1----|----2----|----3----|----4----|----5----|----6----|----7----|----8
+
+  Web-optimized copies of the figures and animations for the Quarto site.
+
+  `figures/*.png` and `figures/*.mp4` are full-size outputs (the videos are
+  encoded at dpi=200). This stage writes size-budgeted versions to
+  `figures/web/` for the blog:
+
+    - responsive WebP and AVIF image sets at a few widths, each kept under
+      IMAGE_BUDGET_KB by lowering quality until it fits
+    - for each video (only with `videos=True`, `tw.py web-assets --videos`):
+      a re-encoded full version, a short low-bitrate preview and a poster
+      frame (the final frame, where the whole chart is drawn)
+    - an HTML snippet per asset (`figures/web/<name>.md`) that `index.qmd`
+      pulls in with the include shortcode
+
+  The blog draws the rankings and strokes gained charts in the browser
+  (`chart_data.py`), so the videos are skipped by default and never count
+  towards the page total. AVIF is written only when the installed Pillow supports it.
+  Videos need ffmpeg (same install as the animations in `TW_2.py` /
+  `TW_3.py`).
+
+  The page weight is printed before (what the original page served: three
+  PNGs and two MP4s) and after (the images the page shows plus the chart
+  scripts). Images only shown inside `<noscript>` and any encoded videos
+  are listed separately, as most readers never download them.
+"""
+
+
+
+# ============================================================================
+# 0. IMPORTS
+# ============================================================================
+
+import os
+import glob
+import shutil
+import subprocess
+import tempfile
+from PIL import Image, features
+
+
+
+# ============================================================================
+# 1. SETTINGS
+# ============================================================================
+
+FIGURES_DIR = "figures"
+WEB_DIR = "figures/web"
+
+# Path to local ffmpeg (falls back to ffmpeg on PATH)
+FFMPEG_PATH = r"C:\ffmpeg\bin\ffmpeg.exe"
+
+# Responsive widths (px) and size budget per image
+IMAGE_WIDTHS = (480, 960, 1400)
+IMAGE_BUDGET_KB = 120
+IMAGE_QUALITY = (80, 70, 60, 50, 40)
+
+# Video settings
+VIDEO_WIDTH = 1600
+VIDEO_CRF = 30
+PREVIEW_WIDTH = 640
+PREVIEW_SECONDS = 8
+PREVIEW_BITRATE = "250k"
+
+# Layout width of the blog body, used for the `sizes` attribute
+PAGE_WIDTH = 900
+
+# What the original page served, and the scripts the page loads now (for the page-weight report)
+BASELINE_ASSETS = [
+    "figures/win_vs_cuts.png",
+    "figures/top5_vs_top10.png",
+    "figures/earnings.png",
+    "figures/animated_rankings.mp4",
+    "figures/animated_strokesgained.mp4",
+]
+PAGE_SCRIPTS = ["chart.js", "figures/web/chart_data.js"]
+
+# Images only shown to readers without JavaScript (the interactive charts' fallbacks)
+NOSCRIPT_IMAGES = ("rankings_static", "strokesgained_static")
+
+# Alt text for each figure (falls back to the file name)
+ALT_TEXT = {
+    "win_vs_cuts": "Win percentage against cuts made percentage for PGA Tour players with 20+ starts",
+    "top5_vs_top10": "Top 5 finish percentage against top 10 finish percentage for PGA Tour players",
+    "earnings": "Top 20 PGA Tour career earnings of all time",
+    "animated_rankings": "Animated world rankings of former world No. 1s over time",
+    "animated_strokesgained": "Animated total strokes gained of the top players each season",
+    "rankings_static": "World rankings of former world No. 1s over time, with Tiger Woods highlighted",
+    "strokesgained_static": "Total strokes gained of the top players each season, with Tiger Woods highlighted",
+}
+
+
+
+# ============================================================================
+# 2. IMAGES
+# ============================================================================
+
+# Save `img` as `fmt`, stepping quality down until the file is within budget
+def save_within_budget(img, path, fmt):
+    for quality in IMAGE_QUALITY:
+        img.save(path, fmt, quality=quality)
+        if os.path.getsize(path) <= IMAGE_BUDGET_KB * 1024:
+            break
+    else:
+        print(f"Warning: {path} is {kb(os.path.getsize(path))} at quality {quality}, over the {IMAGE_BUDGET_KB} KB budget")
+    return os.path.getsize(path)
+
+# Responsive WebP / AVIF set for one PNG, returns the HTML snippet and largest sizes
+def export_image(png_path):
+    name = os.path.splitext(os.path.basename(png_path))[0]
+    formats = [("webp", "WEBP")]
+    if features.check("avif"):
+        formats.insert(0, ("avif", "AVIF"))
+
+    with Image.open(png_path) as src:
+        src = src.convert("RGB")
+        full_width, full_height = src.size
+        widths = sorted({min(w, full_width) for w in IMAGE_WIDTHS})
+
+        srcsets = {ext: [] for ext, _ in formats}
+        largest = {ext: 0 for ext, _ in formats}
+        for width in widths:
+            height = round(full_height * width / full_width)
+            img = src if width == full_width else src.resize((width, height), Image.LANCZOS)
+            for ext, fmt in formats:
+                out = f"{WEB_DIR}/{name}-{width}.{ext}"
+                size = save_within_budget(img, out, fmt)
+                srcsets[ext].append(f"{out} {width}w")
+                if width == widths[-1]:
+                    largest[ext] = size
+
+    sizes = f"(max-width: {PAGE_WIDTH}px) 100vw, {PAGE_WIDTH}px"
+    sources = "".join(
+        f'<source type="image/{ext}" srcset="{", ".join(srcsets[ext])}" sizes="{sizes}">'
+        for ext, _ in formats
+    )
+    fallback = f"{WEB_DIR}/{name}-{widths[-1]}.webp"
+    snippet = (
+        f'<picture>{sources}'
+        f'<img src="{fallback}" alt="{ALT_TEXT.get(name, name)}" loading="lazy" '
+        f'width="{full_width}" height="{full_height}" style="max-width: 100%; height: auto;">'
+        f'</picture>\n'
+    )
+    # Browsers pick the first supported format, so AVIF is what most readers download
+    return snippet, largest[formats[0][0]]
+
+
+
+# ============================================================================
+# 3. VIDEOS
+# ============================================================================
+
+def run_ffmpeg(*args):
+    ffmpeg = FFMPEG_PATH if os.path.exists(FFMPEG_PATH) else "ffmpeg"
+    subprocess.run([ffmpeg, "-y", "-loglevel", "error", *args], check=True)
+
+# Full encode, short preview and poster frame for one MP4, returns the HTML snippet and preview + poster size
+def export_video(mp4_path):
+    name = os.path.splitext(os.path.basename(mp4_path))[0]
+    full = f"{WEB_DIR}/{name}.mp4"
+    preview = f"{WEB_DIR}/{name}-preview.mp4"
+    poster = f"{WEB_DIR}/{name}-poster.webp"
+
+    # Full animation: smaller frame, constant quality, moov atom up front so it streams
+    run_ffmpeg(
+        "-i", mp4_path, "-vf", f"scale={VIDEO_WIDTH}:-2", "-c:v", "libx264",
+        "-crf", str(VIDEO_CRF), "-preset", "slow", "-pix_fmt", "yuv420p",
+        "-movflags", "+faststart", "-an", full,
+    )
+
+    # Preview: first few seconds, small frame, low bitrate
+    run_ffmpeg(
+        "-i", mp4_path, "-t", str(PREVIEW_SECONDS), "-vf", f"scale={PREVIEW_WIDTH}:-2",
+        "-c:v", "libx264", "-b:v", PREVIEW_BITRATE, "-preset", "slow", "-pix_fmt", "yuv420p",
+        "-movflags", "+faststart", "-an", preview,
+    )
+
+    # Poster: final frame of the animation
+    with tempfile.TemporaryDirectory() as tmp:
+        frame = os.path.join(tmp, "poster.png")
+        run_ffmpeg("-sseof", "-0.5", "-i", mp4_path, "-frames:v", "1", "-vf", f"scale={VIDEO_WIDTH}:-2", frame)
+        with Image.open(frame) as img:
+            save_within_budget(img.convert("RGB"), poster, "WEBP")
+
+    snippet = (
+        f'<video autoplay muted loop playsinline preload="none" poster="{poster}" '
+        f'aria-label="{ALT_TEXT.get(name, name)}" style="width: 100%; height: auto;">'
+        f'<source src="{preview}" type="video/mp4"></video>\n\n'
+        f'[Watch the full animation]({full})\n'
+    )
+    return snippet, os.path.getsize(preview) + os.path.getsize(poster)
+
+
+
+# ============================================================================
+# 4. EXPORT STAGE
+# ============================================================================
+
+def kb(n):
+    return "-" if n is None else f"{n / 1024:,.0f} KB"
+
+def size_or_none(path):
+    return os.path.getsize(path) if os.path.exists(path) else None
+
+def print_rows(title, rows):
+    print(title)
+    for name, original, size in rows:
+        print(f"  {name:<30}{kb(original):>12}{kb(size):>12}")
+
+# Build every web asset and report page weight before and after
+def export_web_assets(videos=False):
+    os.makedirs(WEB_DIR, exist_ok=True)
+    web_sizes = {}
+    video_rows = []
+
+    for png_path in sorted(glob.glob(f"{FIGURES_DIR}/*.png")):
+        snippet, size = export_image(png_path)
+        name = os.path.splitext(os.path.basename(png_path))[0]
+        with open(f"{WEB_DIR}/{name}.md", "w", encoding="utf-8") as f:
+            f.write(snippet)
+        web_sizes[name] = (os.path.getsize(png_path), size)
+
+    if not videos:
+        print("Skipping videos (the page uses the interactive charts, pass --videos to encode them)")
+    elif shutil.which("ffmpeg") or os.path.exists(FFMPEG_PATH):
+        for mp4_path in sorted(glob.glob(f"{FIGURES_DIR}/*.mp4")):
+            snippet, size = export_video(mp4_path)
+            name = os.path.splitext(os.path.basename(mp4_path))[0]
+            with open(f"{WEB_DIR}/{name}.md", "w", encoding="utf-8") as f:
+                f.write(snippet)
+            video_rows.append((os.path.basename(mp4_path), os.path.getsize(mp4_path), size))
+    else:
+        # Without ffmpeg the snippets point at the original encodes
+        print("ffmpeg not found, skipping video encodes")
+        for mp4_path in sorted(glob.glob(f"{FIGURES_DIR}/*.mp4")):
+            name = os.path.splitext(os.path.basename(mp4_path))[0]
+            with open(f"{WEB_DIR}/{name}.md", "w", encoding="utf-8") as f:
+                f.write(f'<video controls preload="metadata" src="{mp4_path}" style="width: 100%; height: auto;"></video>\n')
+            original = os.path.getsize(mp4_path)
+            video_rows.append((os.path.basename(mp4_path), original, original))
+
+    # Page weight: the original page's assets against what the page loads now
+    # (after = largest image variant, the original videos are replaced by the chart scripts)
+    page_rows = []
+    for path in BASELINE_ASSETS:
+        name = os.path.splitext(os.path.basename(path))[0]
+        after = web_sizes[name][1] if path.endswith(".png") and name in web_sizes else None
+        page_rows.append((os.path.basename(path), size_or_none(path), after))
+    page_rows += [(os.path.basename(path), None, size_or_none(path)) for path in PAGE_SCRIPTS]
+    before = sum(row[1] or 0 for row in page_rows)
+    after = sum(row[2] or 0 for row in page_rows)
+
+    print(f"  {'asset':<30}{'before':>12}{'after':>12}")
+    print_rows("Page (every reader)", page_rows)
+    print(f"  {'total page weight':<30}{kb(before):>12}{kb(after):>12}")
+    missing = [path for path in BASELINE_ASSETS + PAGE_SCRIPTS if not os.path.exists(path)]
+    if missing:
+        print("  not found, so not counted: " + ", ".join(missing))
+
+    noscript_rows = [(name + ".png", *web_sizes[name]) for name in NOSCRIPT_IMAGES if name in web_sizes]
+    if noscript_rows:
+        print_rows("Only without JavaScript (<noscript> fallbacks, not in the total)", noscript_rows)
+    if video_rows:
+        print_rows("Videos (not on the page, not in the total)", video_rows)
+    return before, after
+
+
+
+if __name__ == "__main__":
+    export_web_assets()